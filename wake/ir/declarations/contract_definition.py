@@ -3,7 +3,8 @@ from __future__ import annotations
 import re
 import weakref
 from bisect import bisect
-from functools import lru_cache, partial
+from functools import cached_property, partial
+from itertools import chain
 from typing import (
     TYPE_CHECKING,
     FrozenSet,
@@ -16,8 +17,6 @@ from typing import (
     Union,
 )
 
-from wake.utils.decorators import weak_self_lru_cache
-
 from ...regex_parser import SoliditySourceParser
 from ..abc import IrAbc, is_not_none
 from ..meta.inheritance_specifier import InheritanceSpecifier
@@ -61,6 +60,30 @@ from wake.ir.meta.storage_layout_specifier import StorageLayoutSpecifier
 from wake.ir.meta.structured_documentation import StructuredDocumentation
 from wake.ir.utils import IrInitTuple
 
+_IDENTIFIER = rb"[a-zA-Z$_][a-zA-Z0-9$_]*"
+_NAME_RE = re.compile(
+    rb"^\s*(?:(?:abstract\s+)?contract|interface|library)\s+(?P<name>"
+    + _IDENTIFIER
+    + rb")"
+)
+
+# exact solc AST type -> (target attribute, IR class); solc AST types are
+# final, so a type() keyed lookup is equivalent to the isinstance chain
+_NODE_DISPATCH = {
+    SolcEnumDefinition: ("_enums", EnumDefinition),
+    SolcErrorDefinition: ("_errors", ErrorDefinition),
+    SolcEventDefinition: ("_events", EventDefinition),
+    SolcFunctionDefinition: ("_functions", FunctionDefinition),
+    SolcModifierDefinition: ("_modifiers", ModifierDefinition),
+    SolcStructDefinition: ("_structs", StructDefinition),
+    SolcUserDefinedValueTypeDefinition: (
+        "_user_defined_value_types",
+        UserDefinedValueTypeDefinition,
+    ),
+    SolcUsingForDirective: ("_using_for_directives", UsingForDirective),
+    SolcVariableDeclaration: ("_declared_variables", VariableDeclaration),
+}
+
 
 class ContractDefinition(DeclarationAbc):
     """
@@ -93,24 +116,25 @@ class ContractDefinition(DeclarationAbc):
     _parent: weakref.ReferenceType[SourceUnit]
 
     _abstract: bool
-    _base_contracts: List[InheritanceSpecifier]
+    _base_contracts: Tuple[InheritanceSpecifier, ...]
     # ___dependencies
     _kind: ContractKind
     _fully_implemented: Optional[bool]
     _linearized_base_contracts: List[AstNodeId]
+    _linearized_base_contracts_resolved: Optional[Tuple[ContractDefinition, ...]]
     # __scope
     _documentation: Optional[Union[StructuredDocumentation, str]]
     _compilation_info: Optional[SolcOutputContractInfo]
     _used_errors: List[AstNodeId]
-    _enums: List[EnumDefinition]
-    _errors: List[ErrorDefinition]
-    _events: List[EventDefinition]
-    _functions: List[FunctionDefinition]
-    _modifiers: List[ModifierDefinition]
-    _structs: List[StructDefinition]
-    _user_defined_value_types: List[UserDefinedValueTypeDefinition]
-    _using_for_directives: List[UsingForDirective]
-    _declared_variables: List[VariableDeclaration]
+    _enums: Tuple[EnumDefinition, ...]
+    _errors: Tuple[ErrorDefinition, ...]
+    _events: Tuple[EventDefinition, ...]
+    _functions: Tuple[FunctionDefinition, ...]
+    _modifiers: Tuple[ModifierDefinition, ...]
+    _structs: Tuple[StructDefinition, ...]
+    _user_defined_value_types: Tuple[UserDefinedValueTypeDefinition, ...]
+    _using_for_directives: Tuple[UsingForDirective, ...]
+    _declared_variables: Tuple[VariableDeclaration, ...]
     _storage_layout: Optional[StorageLayoutSpecifier]
 
     _used_event_ids: List[AstNodeId]
@@ -118,6 +142,9 @@ class ContractDefinition(DeclarationAbc):
     # _internal_function_ids
 
     _child_contracts: Set[weakref.ReferenceType[ContractDefinition]]
+    _child_contracts_frozen: Optional[FrozenSet[ContractDefinition]]
+
+    _direct_children: Tuple[IrAbc, ...]
 
     def __init__(
         self, init: IrInitTuple, contract: SolcContractDefinition, parent: SourceUnit
@@ -127,6 +154,7 @@ class ContractDefinition(DeclarationAbc):
         self._kind = contract.contract_kind
         self._fully_implemented = contract.fully_implemented
         self._linearized_base_contracts = list(contract.linearized_base_contracts)
+        self._linearized_base_contracts_resolved = None
         self._used_errors = (
             list(contract.used_errors) if contract.used_errors is not None else []
         )
@@ -137,11 +165,11 @@ class ContractDefinition(DeclarationAbc):
 
         if contract.documentation is None:
             self._documentation = None
-        elif isinstance(contract.documentation, SolcStructuredDocumentation):
+        elif type(contract.documentation) is SolcStructuredDocumentation:
             self._documentation = StructuredDocumentation(
                 init, contract.documentation, self
             )
-        elif isinstance(contract.documentation, str):
+        elif type(contract.documentation) is str:
             self._documentation = contract.documentation
         else:
             raise TypeError(
@@ -160,42 +188,39 @@ class ContractDefinition(DeclarationAbc):
         else:
             self._compilation_info = None
 
-        self._base_contracts = []
-        for base_contract in contract.base_contracts:
-            self._base_contracts.append(InheritanceSpecifier(init, base_contract, self))
+        self._base_contracts = tuple(
+            InheritanceSpecifier(init, base_contract, self)
+            for base_contract in contract.base_contracts
+        )
         self._child_contracts = set()
+        self._child_contracts_frozen = None
 
-        self._enums = []
-        self._errors = []
-        self._events = []
-        self._functions = []
-        self._modifiers = []
-        self._structs = []
-        self._user_defined_value_types = []
-        self._using_for_directives = []
-        self._declared_variables = []
+        members = {attr: [] for attr, _ in _NODE_DISPATCH.values()}
 
         for node in contract.nodes:
-            if isinstance(node, SolcEnumDefinition):
-                self._enums.append(EnumDefinition(init, node, self))
-            elif isinstance(node, SolcErrorDefinition):
-                self._errors.append(ErrorDefinition(init, node, self))
-            elif isinstance(node, SolcEventDefinition):
-                self._events.append(EventDefinition(init, node, self))
-            elif isinstance(node, SolcFunctionDefinition):
-                self._functions.append(FunctionDefinition(init, node, self))
-            elif isinstance(node, SolcModifierDefinition):
-                self._modifiers.append(ModifierDefinition(init, node, self))
-            elif isinstance(node, SolcStructDefinition):
-                self._structs.append(StructDefinition(init, node, self))
-            elif isinstance(node, SolcUserDefinedValueTypeDefinition):
-                self._user_defined_value_types.append(
-                    UserDefinedValueTypeDefinition(init, node, self)
-                )
-            elif isinstance(node, SolcUsingForDirective):
-                self._using_for_directives.append(UsingForDirective(init, node, self))
-            elif isinstance(node, SolcVariableDeclaration):
-                self._declared_variables.append(VariableDeclaration(init, node, self))
+            entry = _NODE_DISPATCH.get(type(node))
+            if entry is not None:
+                attr, ir_class = entry
+                members[attr].append(ir_class(init, node, self))
+
+        for attr, member_nodes in members.items():
+            setattr(self, attr, tuple(member_nodes))
+
+        direct_children: List[IrAbc] = list(self._base_contracts)
+        if isinstance(self._documentation, StructuredDocumentation):
+            direct_children.append(self._documentation)
+        if self._storage_layout is not None:
+            direct_children.append(self._storage_layout)
+        direct_children.extend(self._enums)
+        direct_children.extend(self._errors)
+        direct_children.extend(self._events)
+        direct_children.extend(self._functions)
+        direct_children.extend(self._modifiers)
+        direct_children.extend(self._structs)
+        direct_children.extend(self._user_defined_value_types)
+        direct_children.extend(self._using_for_directives)
+        direct_children.extend(self._declared_variables)
+        self._direct_children = tuple(direct_children)
 
         init.reference_resolver.register_post_process_callback(self._post_process)
         init.reference_resolver.register_post_process_callback(
@@ -204,41 +229,23 @@ class ContractDefinition(DeclarationAbc):
 
     def __iter__(self) -> Iterator[IrAbc]:
         yield self
-        for base_contract in self._base_contracts:
-            yield from base_contract
-        if isinstance(self._documentation, StructuredDocumentation):
-            yield from self._documentation
-        if self._storage_layout is not None:
-            yield from self._storage_layout
-        for enum in self._enums:
-            yield from enum
-        for error in self._errors:
-            yield from error
-        for event in self._events:
-            yield from event
-        for function in self._functions:
-            yield from function
-        for modifier in self._modifiers:
-            yield from modifier
-        for struct in self._structs:
-            yield from struct
-        for user_defined_value_type in self._user_defined_value_types:
-            yield from user_defined_value_type
-        for using_for_directive in self._using_for_directives:
-            yield from using_for_directive
-        for declared_variable in self._declared_variables:
-            yield from declared_variable
+        for child in self._direct_children:
+            yield from child
 
     def __setstate__(self, state):
         super().__setstate__(state)
         self._used_events = set()
         self._child_contracts = set()
+        self._child_contracts_frozen = None
+        self._linearized_base_contracts_resolved = None
 
     @classmethod
     def _strip_weakrefs(cls, state: dict):
         super()._strip_weakrefs(state)
         del state["_used_events"]
         del state["_child_contracts"]
+        del state["_child_contracts_frozen"]
+        del state["_linearized_base_contracts_resolved"]
 
     def _post_process(self, callback_params: CallbackParams):
         base_contracts = []
@@ -246,6 +253,7 @@ class ContractDefinition(DeclarationAbc):
             contract = base_contract.base_name.referenced_declaration
             assert isinstance(contract, ContractDefinition)
             contract._child_contracts.add(weakref.ref(self))
+            contract._child_contracts_frozen = None
             base_contracts.append(contract)
 
         for error in self.used_errors:
@@ -301,6 +309,7 @@ class ContractDefinition(DeclarationAbc):
         for base_contract in base_contracts:
             ref = next(c for c in base_contract._child_contracts if c() is self)
             base_contract._child_contracts.remove(ref)
+            base_contract._child_contracts_frozen = None
         for error in used_errors:
             ref = next(c for c in error._used_in if c() is self)
             error._used_in.remove(ref)
@@ -311,34 +320,10 @@ class ContractDefinition(DeclarationAbc):
             event._used_in.remove(ref)
 
     def _parse_name_location(self) -> Tuple[int, int]:
-        IDENTIFIER = r"[a-zA-Z$_][a-zA-Z0-9$_]*"
-        CONTRACT_RE = re.compile(
-            r"^\s*(abstract\s)?\s*contract\s+(?P<name>{identifier})".format(
-                identifier=IDENTIFIER
-            ).encode("utf-8")
-        )
-        INTERFACE_RE = re.compile(
-            r"^\s*interface\s+(?P<name>{identifier})".format(
-                identifier=IDENTIFIER
-            ).encode("utf-8")
-        )
-        LIBRARY_RE = re.compile(
-            r"^\s*library\s+(?P<name>{identifier})".format(
-                identifier=IDENTIFIER
-            ).encode("utf-8")
-        )
-
         source = bytearray(self._source)
         _, stripped_sums = SoliditySourceParser.strip_comments(source)
 
-        if self.kind == ContractKind.CONTRACT:
-            match = CONTRACT_RE.match(source)
-        elif self.kind == ContractKind.INTERFACE:
-            match = INTERFACE_RE.match(source)
-        elif self.kind == ContractKind.LIBRARY:
-            match = LIBRARY_RE.match(source)
-        else:
-            raise ValueError(f"Unknown contract kind: {self.kind}")
+        match = _NAME_RE.match(source)
         assert match
 
         if len(stripped_sums) == 0:
@@ -386,27 +371,13 @@ class ContractDefinition(DeclarationAbc):
         Yields:
             Direct children of this node.
         """
-        yield from self._base_contracts
-        if isinstance(self._documentation, StructuredDocumentation):
-            yield self._documentation
-        if self._storage_layout is not None:
-            yield self._storage_layout
-        yield from self._enums
-        yield from self._errors
-        yield from self._events
-        yield from self._functions
-        yield from self._modifiers
-        yield from self._structs
-        yield from self._user_defined_value_types
-        yield from self._using_for_directives
-        yield from self._declared_variables
+        return iter(self._direct_children)  # pyright: ignore reportGeneralTypeIssues
 
-    @property
+    @cached_property
     def canonical_name(self) -> str:
         return self._name
 
-    @property
-    @weak_self_lru_cache(maxsize=2048)
+    @cached_property
     def declaration_string(self) -> str:
         ret = f"{'abstract ' if self.abstract else ''}{self.kind} {self.name}"
         ret += (
@@ -416,22 +387,14 @@ class ContractDefinition(DeclarationAbc):
         )
         if isinstance(self.documentation, StructuredDocumentation):
             return (
-                "/// "
-                + "\n///".join(line for line in self.documentation.text.splitlines())
-                + "\n"
-                + ret
+                "/// " + "\n///".join(self.documentation.text.splitlines()) + "\n" + ret
             )
         elif isinstance(self.documentation, str):
-            return (
-                "/// "
-                + "\n///".join(line for line in self.documentation.splitlines())
-                + "\n"
-                + ret
-            )
+            return "/// " + "\n///".join(self.documentation.splitlines()) + "\n" + ret
         else:
             return ret
 
-    @property
+    @cached_property
     def abstract(self) -> bool:
         """
         Is `False` if the [kind][wake.ir.declarations.contract_definition.ContractDefinition.kind] is [ContractKind.LIBRARY][wake.ir.enums.ContractKind.LIBRARY] or [ContractKind.INTERFACE][wake.ir.enums.ContractKind.INTERFACE].
@@ -461,7 +424,7 @@ class ContractDefinition(DeclarationAbc):
         Returns:
             Base contracts of this contract.
         """
-        return tuple(self._base_contracts)
+        return self._base_contracts
 
     @property
     def child_contracts(self) -> FrozenSet[ContractDefinition]:
@@ -471,9 +434,13 @@ class ContractDefinition(DeclarationAbc):
         Returns:
             Contracts that list this contract in their [base_contracts][wake.ir.declarations.contract_definition.ContractDefinition.base_contracts] property.
         """
-        return frozenset(is_not_none(c()) for c in self._child_contracts)
+        if self._child_contracts_frozen is None:
+            self._child_contracts_frozen = frozenset(
+                is_not_none(c()) for c in self._child_contracts
+            )
+        return self._child_contracts_frozen
 
-    @property
+    @cached_property
     def kind(self) -> ContractKind:
         """
         Returns:
@@ -481,7 +448,7 @@ class ContractDefinition(DeclarationAbc):
         """
         return self._kind
 
-    @property
+    @cached_property
     def fully_implemented(self) -> Optional[bool]:
         """
         Is `None` when a file that imports this contract cannot be compiled. This may happen in the LSP server where partial project analysis is supported.
@@ -497,14 +464,16 @@ class ContractDefinition(DeclarationAbc):
         Returns:
             C3 linearized list of all base contracts, including this contract.
         """
-        base_contracts = []
-        for base_contract in self._linearized_base_contracts:
-            node = self._reference_resolver.resolve_node(
-                base_contract, self.source_unit.cu_hash
-            )
-            assert isinstance(node, ContractDefinition)
-            base_contracts.append(node)
-        return tuple(base_contracts)
+        if self._linearized_base_contracts_resolved is None:
+            base_contracts = []
+            for base_contract in self._linearized_base_contracts:
+                node = self._reference_resolver.resolve_node(
+                    base_contract, self.source_unit.cu_hash
+                )
+                assert isinstance(node, ContractDefinition)
+                base_contracts.append(node)
+            self._linearized_base_contracts_resolved = tuple(base_contracts)
+        return self._linearized_base_contracts_resolved
 
     @property
     def used_errors(self) -> FrozenSet[ErrorDefinition]:
@@ -529,7 +498,7 @@ class ContractDefinition(DeclarationAbc):
         """
         return frozenset(is_not_none(e()) for e in self._used_events)
 
-    @property
+    @cached_property
     def documentation(self) -> Optional[Union[StructuredDocumentation, str]]:
         """
         Of [StructuredDocumentation][wake.ir.meta.structured_documentation.StructuredDocumentation] type since Solidity 0.6.3.
@@ -557,7 +526,7 @@ class ContractDefinition(DeclarationAbc):
         Returns:
             Enum definitions contained in this contract.
         """
-        return tuple(self._enums)
+        return self._enums
 
     @property
     def errors(self) -> Tuple[ErrorDefinition, ...]:
@@ -565,7 +534,7 @@ class ContractDefinition(DeclarationAbc):
         Returns:
             Error definitions contained in this contract.
         """
-        return tuple(self._errors)
+        return self._errors
 
     @property
     def events(self) -> Tuple[EventDefinition, ...]:
@@ -573,7 +542,7 @@ class ContractDefinition(DeclarationAbc):
         Returns:
             Event definitions contained in this contract.
         """
-        return tuple(self._events)
+        return self._events
 
     @property
     def functions(self) -> Tuple[FunctionDefinition, ...]:
@@ -581,7 +550,7 @@ class ContractDefinition(DeclarationAbc):
         Returns:
             Function definitions contained in this contract.
         """
-        return tuple(self._functions)
+        return self._functions
 
     @property
     def modifiers(self) -> Tuple[ModifierDefinition, ...]:
@@ -589,7 +558,7 @@ class ContractDefinition(DeclarationAbc):
         Returns:
             Modifier definitions contained in this contract.
         """
-        return tuple(self._modifiers)
+        return self._modifiers
 
     @property
     def structs(self) -> Tuple[StructDefinition, ...]:
@@ -597,7 +566,7 @@ class ContractDefinition(DeclarationAbc):
         Returns:
             Struct definitions contained in this contract.
         """
-        return tuple(self._structs)
+        return self._structs
 
     @property
     def user_defined_value_types(self) -> Tuple[UserDefinedValueTypeDefinition, ...]:
@@ -605,7 +574,7 @@ class ContractDefinition(DeclarationAbc):
         Returns:
             User defined value type definitions contained in this contract.
         """
-        return tuple(self._user_defined_value_types)
+        return self._user_defined_value_types
 
     @property
     def using_for_directives(self) -> Tuple[UsingForDirective, ...]:
@@ -613,7 +582,7 @@ class ContractDefinition(DeclarationAbc):
         Returns:
             Using for directives contained in this contract.
         """
-        return tuple(self._using_for_directives)
+        return self._using_for_directives
 
     @property
     def declared_variables(self) -> Tuple[VariableDeclaration, ...]:
@@ -621,23 +590,30 @@ class ContractDefinition(DeclarationAbc):
         Returns:
             Variable declarations contained in this contract.
         """
-        return tuple(self._declared_variables)
+        return self._declared_variables
+
+    @cached_property
+    def _declarations(self) -> Tuple[DeclarationAbc, ...]:
+        return tuple(
+            chain(
+                self._enums,
+                chain.from_iterable(enum.values for enum in self._enums),
+                self._errors,
+                self._events,
+                self._functions,
+                self._modifiers,
+                self._structs,
+                self._user_defined_value_types,
+                self._declared_variables,
+            )
+        )
 
     def declarations_iter(self) -> Iterator[DeclarationAbc]:
         """
         Yields:
             All declarations contained in this contract.
         """
-        yield from self.enums
-        for enum in self.enums:
-            yield from enum.values
-        yield from self.errors
-        yield from self.events
-        yield from self.functions
-        yield from self.modifiers
-        yield from self.structs
-        yield from self.user_defined_value_types
-        yield from self.declared_variables
+        return iter(self._declarations)
 
     @property
     def references(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import weakref
+from functools import cached_property
 from typing import TYPE_CHECKING, Iterator, List, Optional, Union
 
 from ..expressions.abc import ExpressionAbc
@@ -93,6 +94,14 @@ class InheritanceSpecifier(SolidityAbc):
         if self._arguments is not None:
             yield from self._arguments
 
+    @cached_property
+    def source(self) -> str:
+        """
+        Returns:
+            Source code of the inheritance specifier, decoded once and cached.
+        """
+        return self._source.decode("utf-8")
+
     @property
     def base_name(self) -> Union[IdentifierPath, UserDefinedTypeName]:
         """
@@ -19,6 +19,14 @@ from wake.ir.yul.literal import YulLiteral
 if TYPE_CHECKING:
     from .block import YulBlock
 
+# exact solc AST type -> IR class; solc AST types are final, so a type()
+# keyed lookup is equivalent to the isinstance chain
+_EXPRESSION_DISPATCH = {
+    SolcYulFunctionCall: YulFunctionCall,
+    SolcYulIdentifier: YulIdentifier,
+    SolcYulLiteral: YulLiteral,
+}
+
 
 class YulSwitch(YulStatementAbc):
     """
@@ -53,14 +61,11 @@ class YulSwitch(YulStatementAbc):
 
     def __init__(self, init: IrInitTuple, switch: SolcYulSwitch, parent: YulAbc):
         super().__init__(init, switch, parent)
-        if isinstance(switch.expression, SolcYulFunctionCall):
-            self._expression = YulFunctionCall(init, switch.expression, self)
-        elif isinstance(switch.expression, SolcYulIdentifier):
-            self._expression = YulIdentifier(init, switch.expression, self)
-        elif isinstance(switch.expression, SolcYulLiteral):
-            self._expression = YulLiteral(init, switch.expression, self)
-        else:
-            assert False, f"Unexpected type: {type(switch.expression)}"
+        expression_class = _EXPRESSION_DISPATCH.get(type(switch.expression))
+        assert (
+            expression_class is not None
+        ), f"Unexpected type: {type(switch.expression)}"
+        self._expression = expression_class(init, switch.expression, self)
         self._cases = [YulCase(init, case, self) for case in switch.cases]
 
     def __iter__(self) -> Iterator[YulAbc]: